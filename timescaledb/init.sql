@@ -17,14 +17,18 @@ CREATE TABLE IF NOT EXISTS params (
   id SERIAL PRIMARY KEY,
   run_id INTEGER REFERENCES runs(id),
   name TEXT,
-  value TEXT
+  value TEXT,
+  UNIQUE (run_id, name)
 );
 
 CREATE TABLE IF NOT EXISTS metrics (
   id SERIAL PRIMARY KEY,
   run_id INTEGER REFERENCES runs(id),
   name TEXT,
-  value DOUBLE PRECISION
+  value DOUBLE PRECISION,
+  -- only set when the exporter runs with EXPORT_METRIC_HISTORY enabled
+  timestamp TIMESTAMP,
+  step BIGINT
 );
 
 CREATE INDEX IF NOT EXISTS idx_metrics_run_id ON metrics(run_id);